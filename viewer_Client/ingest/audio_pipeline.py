@@ -1,28 +1,158 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
 import io
 import math
+import os
+import struct
 from typing import List, Optional, Tuple
 
 import numpy as np
 from scipy import signal
 from scipy.io import wavfile
 
+try:
+    from numba import config as _numba_config, njit, prange, set_num_threads as _numba_set_num_threads
+except ImportError:  # numba is optional; the NumPy fallback below is used instead
+    njit = None
+
+# Threads the parallel kernels may use; lowered by `set_num_threads` in worker processes
+_num_threads = os.cpu_count() or 1
+
+
+def set_num_threads(num_threads: int) -> None:
+    """
+    Cap the threads one call may fan out to (numba kernels and tiled resampling).
+
+    Meant for processes that already run one job per CPU, such as the viewer server's workers.
+    """
+    global _num_threads
+    if num_threads <= 0:
+        raise ValueError("num_threads must be > 0")
+    _num_threads = num_threads
+    if njit is not None:
+        _numba_set_num_threads(min(num_threads, _numba_config.NUMBA_NUM_THREADS))
+
+# PCM scale constants, hoisted as float32 scalars so they combine with float32 arrays without
+# an upcast to float64 (and multiplying by a reciprocal instead of dividing)
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+_INT32_SCALE = np.float32(1.0 / 2147483648.0)
+_UINT8_BIAS = np.float32(128.0)
+_UINT8_SCALE = np.float32(1.0 / 128.0)
+_PCM16_MAX = np.float32(32767.0)
+
+
+class _FrozenSlots:
+    """
+    Pickle/copy support for frozen dataclasses with hand-written `__slots__`, as
+    `dataclass(slots=True)` generates on 3.10+: slot state is restored with
+    `object.__setattr__`, since the frozen `__setattr__` would reject it.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class AudioChunkSpec(_FrozenSlots):
+    """Windowing configuration shared by every chunk an `AudioPipeline` produces."""
+
+    __slots__ = ("sample_rate", "window_num_samples", "hop_num_samples", "center_start", "center_num_samples")
 
-@dataclass
-class AudioChunk:
-    stream_id: str
-    seq: int
-    pcm: np.ndarray
     sample_rate: int
     window_num_samples: int
     hop_num_samples: int
     center_start: int
     center_num_samples: int
+
+
+@dataclass(frozen=True)
+class AudioChunk(_FrozenSlots):
+    __slots__ = ("stream_id", "seq", "pcm", "window_time_ns", "center_time_ns", "audio_time_ns", "spec")
+
+    stream_id: str
+    seq: int
+    pcm: np.ndarray
     window_time_ns: int
     center_time_ns: int
     audio_time_ns: int
+    spec: AudioChunkSpec
+
+    @property
+    def sample_rate(self) -> int:
+        return self.spec.sample_rate
+
+    @property
+    def window_num_samples(self) -> int:
+        return self.spec.window_num_samples
+
+    @property
+    def hop_num_samples(self) -> int:
+        return self.spec.hop_num_samples
+
+    @property
+    def center_start(self) -> int:
+        return self.spec.center_start
+
+    @property
+    def center_num_samples(self) -> int:
+        return self.spec.center_num_samples
+
+
+if njit is not None:
+
+    # Serial on purpose: it mostly sees 10-20 ms streaming chunks, where waking a thread team
+    # costs more than the loop itself.
+    @njit(fastmath=True, cache=True)
+    def _int_to_float32_kernel(x, bias, scale, out):
+        for i in range(x.size):
+            out[i] = (x[i] - bias) * scale
+
+else:
+    _int_to_float32_kernel = None
+
+
+def _int_to_float32(pcm: np.ndarray, bias: float, scale: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Compute `(pcm - bias) * scale` as float32 in a single pass over `pcm`."""
+    if out is None:
+        out = np.empty(pcm.shape, dtype=np.float32)
+
+    if _int_to_float32_kernel is not None:
+        _int_to_float32_kernel(pcm.reshape(-1), bias, scale, out.reshape(-1))
+    elif bias:
+        np.subtract(pcm, bias, out=out, dtype=np.float32)
+        np.multiply(out, scale, out=out)
+    else:
+        np.multiply(pcm, scale, out=out, dtype=np.float32)
+    return out
+
+
+# (bias, scale) mapping each integer PCM dtype to float32 in [-1.0, 1.0)
+_INT_PCM_SCALING = {
+    np.dtype(np.int16): (np.float32(0.0), _INT16_SCALE),
+    np.dtype(np.int32): (np.float32(0.0), _INT32_SCALE),
+    np.dtype(np.uint8): (_UINT8_BIAS, _UINT8_SCALE),
+}
+
+
+def _pcm_to_float32(pcm: np.ndarray) -> np.ndarray:
+    """Normalize integer PCM to float32 in [-1.0, 1.0); floating-point input is only cast."""
+    if np.issubdtype(pcm.dtype, np.floating):
+        return pcm.astype(np.float32, copy=False)
+
+    scaling = _INT_PCM_SCALING.get(pcm.dtype)
+    if scaling is not None:
+        return _int_to_float32(pcm, *scaling)
+
+    return pcm.astype(np.float32)
 
 
 def _to_mono_float32(pcm: np.ndarray) -> np.ndarray:
@@ -32,28 +162,127 @@ def _to_mono_float32(pcm: np.ndarray) -> np.ndarray:
     if pcm.ndim > 1:
         pcm = np.mean(pcm, axis=1, dtype=np.float32)
 
-    if np.issubdtype(pcm.dtype, np.floating):
-        return pcm.astype(np.float32, copy=False)
+    return _pcm_to_float32(pcm)
 
-    if pcm.dtype == np.int16:
-        return (pcm.astype(np.float32) / 32768.0).astype(np.float32, copy=False)
-    if pcm.dtype == np.int32:
-        return (pcm.astype(np.float32) / 2147483648.0).astype(np.float32, copy=False)
-    if pcm.dtype == np.uint8:
-        return ((pcm.astype(np.float32) - 128.0) / 128.0).astype(np.float32, copy=False)
 
-    return pcm.astype(np.float32)
+# Largest up/down factor whose filters are cached. Every pair of the usual 8-96 kHz rates stays
+# far below it (44.1 kHz -> 16 kHz is 160/441); coprime rates such as 192000 -> 191999, which an
+# upload can ask for, need filters of tens of megabytes and are designed per call instead.
+_MAX_CACHED_FILTER_FACTOR = 4096
+
+
+def _filter_cache(design):
+    """`functools.lru_cache` for a filter keyed on up/down factors, bypassed for large factors."""
+    cached = functools.lru_cache(maxsize=32)(design)
+
+    @functools.wraps(design)
+    def get(*factors: int):
+        if max(factors) <= _MAX_CACHED_FILTER_FACTOR:
+            return cached(*factors)
+        return design(*factors)
+
+    return get
+
+
+@_filter_cache
+def _lowpass_taps(up: int, down: int) -> np.ndarray:
+    """
+    The Kaiser (beta=5.0) low-pass `signal.resample_poly` designs by default for `up`/`down`;
+    caching it avoids redesigning the FIR on every streamed chunk.
+    """
+    max_rate = max(up, down)
+    taps = signal.firwin(2 * max_rate * 10 + 1, 1.0 / max_rate, window=("kaiser", 5.0)).astype(np.float32)
+    taps.setflags(write=False)
+    return taps
+
+
+def _resample_ratio(original_sample_rate: int, target_sample_rate: int) -> Tuple[int, int]:
+    gcd = math.gcd(original_sample_rate, target_sample_rate)
+    return target_sample_rate // gcd, original_sample_rate // gcd
+
+
+def _resample_filter(original_sample_rate: int, target_sample_rate: int) -> Tuple[int, int, np.ndarray]:
+    """Return (up, down, taps) for resampling between the two rates."""
+    up, down = _resample_ratio(original_sample_rate, target_sample_rate)
+    return up, down, _lowpass_taps(up, down)
+
+
+@_filter_cache
+def _decimation_filter(down: int) -> Tuple[np.ndarray, int]:
+    """
+    Return (taps, num_pre_remove) for integer-ratio decimation by `down` with `signal.upfirdn`.
+
+    The taps are the `_lowpass_taps` low-pass, front-padded the way `signal.resample_poly`
+    pads them, so dropping `num_pre_remove` leading outputs reproduces `resample_poly` exactly.
+    """
+    taps = _lowpass_taps(1, down)
+    half_len = (taps.shape[0] - 1) // 2
+    num_pre_pad = down - half_len % down
+    padded = np.concatenate((np.zeros((num_pre_pad,), dtype=taps.dtype), taps))
+    padded.setflags(write=False)
+    return padded, (half_len + num_pre_pad) // down
+
+
+def _resample_poly(pcm: np.ndarray, up: int, down: int, taps: np.ndarray) -> np.ndarray:
+    # upfirdn walks the signal with unit stride; make sure it gets a contiguous 1-D buffer
+    pcm = np.ascontiguousarray(pcm)
+    if up == 1:
+        # Integer ratio (e.g. 48 kHz -> 16 kHz): call upfirdn directly with the cached padded
+        # filter instead of letting resample_poly re-pad the taps on every call.
+        padded, num_pre_remove = _decimation_filter(down)
+        num_out = -(-pcm.shape[0] // down)
+        return signal.upfirdn(padded, pcm, 1, down)[num_pre_remove:num_pre_remove + num_out]
+    # Zero ("constant") padding is what the decimation branch above reproduces, and unlike
+    # the background-removing padtypes it needs no extra pass over the signal.
+    return signal.resample_poly(pcm, up, down, axis=0, window=taps, padtype="constant")
+
+
+# Minimum input samples per tile before a long signal is resampled in parallel
+_PARALLEL_RESAMPLE_MIN_TILE = 1 << 18
+
+
+def _resample_tiled(pcm: np.ndarray, up: int, down: int, taps: np.ndarray, max_tiles: int) -> np.ndarray:
+    """
+    `_resample_poly` for long signals, split into at most `max_tiles` tiles that are resampled
+    on a thread pool (upfirdn releases the GIL).
+
+    Tiles start on multiples of `down` input samples, i.e. multiples of `up` output samples, so
+    they all share the output grid of the whole signal. Each tile also reads enough input on both
+    sides to cover the filter and keeps only its own outputs, so the result is identical to
+    resampling the signal in one call.
+    """
+    num_in = pcm.shape[0]
+    num_tiles = min(max_tiles, num_in // _PARALLEL_RESAMPLE_MIN_TILE)
+    if num_tiles <= 1:
+        return _resample_poly(pcm, up, down, taps)
+
+    half_len = (taps.shape[0] - 1) // 2
+    overlap = down * -(-(half_len // up + 2) // down)
+    step = down * -(-num_in // (num_tiles * down))
+    num_out = -(-num_in * up // down)
+    out = np.empty((num_out,), dtype=np.float32)
+
+    def resample_tile(start: int) -> None:
+        end = min(start + step, num_in)
+        lo = max(start - overlap, 0)
+        tile = _resample_poly(pcm[lo:min(end + overlap, num_in)], up, down, taps)
+
+        out_start = start // down * up
+        out_end = num_out if end == num_in else end // down * up
+        skip = (start - lo) // down * up
+        out[out_start:out_end] = tile[skip:skip + out_end - out_start]
+
+    with ThreadPoolExecutor(max_workers=num_tiles) as executor:
+        list(executor.map(resample_tile, range(0, num_in, step)))
+    return out
 
 
 def _resample_mono_float32(pcm: np.ndarray, original_sample_rate: int, target_sample_rate: int) -> np.ndarray:
     if original_sample_rate == target_sample_rate:
         return pcm.astype(np.float32, copy=False)
 
-    gcd = math.gcd(original_sample_rate, target_sample_rate)
-    up = target_sample_rate // gcd
-    down = original_sample_rate // gcd
-
-    out = signal.resample_poly(pcm, up, down)
+    up, down, taps = _resample_filter(int(original_sample_rate), int(target_sample_rate))
+    out = _resample_tiled(pcm, up, down, taps, _num_threads)
     return out.astype(np.float32, copy=False)
 
 
@@ -61,10 +290,140 @@ def _float32_to_pcm16le(pcm: np.ndarray) -> np.ndarray:
     if pcm.size == 0:
         return np.empty((0,), dtype="<i2")
 
-    clipped = np.clip(pcm, -1.0, 1.0).astype(np.float32, copy=False)
-    scaled = np.round(clipped * 32768.0)
-    scaled = np.clip(scaled, -32768.0, 32767.0)
-    return scaled.astype("<i2")
+    # Scale by 32767 so the rounded result is already in range: one scratch buffer,
+    # every pass in place, then a single cast into the output array.
+    scaled = np.empty(pcm.shape, dtype=np.float32)
+    np.multiply(pcm, _PCM16_MAX, out=scaled)
+    np.clip(scaled, -_PCM16_MAX, _PCM16_MAX, out=scaled)
+    np.rint(scaled, out=scaled)
+    out = np.empty(pcm.shape, dtype="<i2")
+    np.copyto(out, scaled, casting="unsafe")
+    return out
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _resample_to_pcm16_kernel(x, phases, half_len, up, down, out):
+        # Polyphase form of resample_poly: output m is centred on sample m * down + half_len of
+        # the zero-stuffed input, so it only needs the taps of one phase, against a contiguous
+        # run of real input samples (the inner loop is a plain dot product and vectorizes).
+        num_taps = phases.shape[1]
+        for m in prange(out.size):
+            center = m * down + half_len
+            phase = center % up
+            last = (center - phase) // up
+            first = last - (num_taps - 1)
+            row = phases[phase]
+            acc = np.float32(0.0)
+            if first >= 0 and last < x.size:
+                window = x[first:last + 1]
+                for j in range(num_taps):
+                    acc += row[j] * window[j]
+            else:
+                # Edges: the zero padding resample_poly applies contributes nothing, so skip it.
+                for k in range(max(first, 0), min(last, x.size - 1) + 1):
+                    acc += row[k - first] * x[k]
+
+            # Same quantization as _float32_to_pcm16le
+            value = acc * _PCM16_MAX
+            if value > _PCM16_MAX:
+                value = _PCM16_MAX
+            elif value < -_PCM16_MAX:
+                value = -_PCM16_MAX
+            out[m] = np.int16(np.rint(value))
+
+else:
+    _resample_to_pcm16_kernel = None
+
+
+@_filter_cache
+def _polyphase_filter(up: int, down: int) -> Tuple[np.ndarray, int]:
+    """
+    Return (phases, half_len): the `_lowpass_taps` taps (scaled by `up`, as resample_poly does)
+    split into `up` phases, and the filter's half length.
+
+    Row p holds taps p, p + up, p + 2 * up, ... in reverse order, zero-padded at the front, so
+    it lines up with input samples in increasing order.
+    """
+    taps = _lowpass_taps(up, down)
+    num_taps = -(-taps.shape[0] // up)
+    padded = np.zeros((up * num_taps,), dtype=np.float32)
+    padded[:taps.shape[0]] = taps * np.float32(up)
+    phases = np.ascontiguousarray(padded.reshape(num_taps, up).T[:, ::-1])
+    phases.setflags(write=False)
+    return phases, (taps.shape[0] - 1) // 2
+
+
+def _resample_to_pcm16le(pcm: np.ndarray, original_sample_rate: int, target_sample_rate: int) -> np.ndarray:
+    """
+    Resample mono float32 audio and quantize it like `_float32_to_pcm16le`.
+
+    With numba the filter and the quantization run as one parallel pass that writes int16
+    directly; otherwise this is `_resample_mono_float32` followed by `_float32_to_pcm16le`.
+    """
+    if _resample_to_pcm16_kernel is None or original_sample_rate == target_sample_rate or pcm.size == 0:
+        return _float32_to_pcm16le(_resample_mono_float32(pcm, original_sample_rate, target_sample_rate))
+
+    up, down = _resample_ratio(int(original_sample_rate), int(target_sample_rate))
+    phases, half_len = _polyphase_filter(up, down)
+    out = np.empty((-(-pcm.shape[0] * up // down),), dtype="<i2")
+    _resample_to_pcm16_kernel(np.ascontiguousarray(pcm, dtype=np.float32), phases, half_len, up, down, out)
+    return out
+
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# (format tag, bits per sample) -> sample dtype for the layouts read without copying
+_WAV_DTYPES = {
+    (_WAVE_FORMAT_PCM, 8): np.dtype("u1"),
+    (_WAVE_FORMAT_PCM, 16): np.dtype("<i2"),
+    (_WAVE_FORMAT_PCM, 32): np.dtype("<i4"),
+    (_WAVE_FORMAT_IEEE_FLOAT, 32): np.dtype("<f4"),
+    (_WAVE_FORMAT_IEEE_FLOAT, 64): np.dtype("<f8"),
+}
+
+
+def _read_wav(wav_bytes: bytes) -> Tuple[int, np.ndarray]:
+    """
+    Return (sample_rate, pcm) for an in-memory WAV file, shaped like `wavfile.read`.
+
+    For little-endian PCM/float data the samples are an `np.frombuffer` view over
+    `wav_bytes`, so the upload is never copied; other layouts go through `wavfile.read`.
+    """
+    if len(wav_bytes) >= 12 and wav_bytes[0:4] == b"RIFF" and wav_bytes[8:12] == b"WAVE":
+        fmt = None
+        offset = 12
+        while offset + 8 <= len(wav_bytes):
+            chunk_id, chunk_size = struct.unpack_from("<4sI", wav_bytes, offset)
+            offset += 8
+            if chunk_id == b"fmt " and chunk_size >= 16:
+                if offset + chunk_size > len(wav_bytes):
+                    break  # truncated header; let wavfile.read report it
+                format_tag, channels, sample_rate, _, _, bits_per_sample = struct.unpack_from("<HHIIHH", wav_bytes, offset)
+                if format_tag == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                    # The real format code is the first two bytes of the SubFormat GUID
+                    (format_tag,) = struct.unpack_from("<H", wav_bytes, offset + 24)
+                fmt = (format_tag, channels, sample_rate, bits_per_sample)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    break
+                format_tag, channels, sample_rate, bits_per_sample = fmt
+                dtype = _WAV_DTYPES.get((format_tag, bits_per_sample))
+                if dtype is None or channels <= 0:
+                    break
+
+                data_len = min(chunk_size, len(wav_bytes) - offset)
+                num_frames = data_len // (dtype.itemsize * channels)
+                pcm = np.frombuffer(wav_bytes, dtype=dtype, count=num_frames * channels, offset=offset)
+                if channels > 1:
+                    pcm = pcm.reshape(-1, channels)
+                return sample_rate, pcm
+            offset += chunk_size + (chunk_size & 1)
+
+    return wavfile.read(io.BytesIO(wav_bytes))
 
 
 def process_wav_bytes_to_pcm16_chunks(
@@ -81,21 +440,22 @@ def process_wav_bytes_to_pcm16_chunks(
     if chunk_duration_s <= 0:
         raise ValueError("chunk_duration_s must be > 0")
 
-    src_sample_rate, pcm = wavfile.read(io.BytesIO(wav_bytes))
+    src_sample_rate, pcm = _read_wav(wav_bytes)
     pcm_f32 = _to_mono_float32(pcm)
-    pcm_f32 = _resample_mono_float32(pcm_f32, int(src_sample_rate), int(target_sample_rate))
 
     chunk_samples = int(round(target_sample_rate * chunk_duration_s))
     if chunk_samples <= 0:
         raise ValueError("Invalid chunk size")
 
-    chunks: List[Tuple[int, bytes]] = []
-    start = 0
-    while start < pcm_f32.shape[0]:
-        end = min(pcm_f32.shape[0], start + chunk_samples)
-        pcm16 = _float32_to_pcm16le(pcm_f32[start:end])
-        chunks.append((start, pcm16.tobytes()))
-        start += chunk_samples
+    # Resample and quantize the whole signal once, view the full chunks as rows, then copy each row's bytes out.
+    pcm16_all = _resample_to_pcm16le(pcm_f32, int(src_sample_rate), int(target_sample_rate))
+    num_full = pcm16_all.shape[0] // chunk_samples
+    full_end = num_full * chunk_samples
+    rows = pcm16_all[:full_end].reshape(num_full, chunk_samples)
+
+    chunks: List[Tuple[int, bytes]] = [(i * chunk_samples, row.tobytes()) for i, row in enumerate(rows)]
+    if full_end < pcm16_all.shape[0]:
+        chunks.append((full_end, pcm16_all[full_end:].tobytes()))
 
     return int(target_sample_rate), chunks
 
@@ -114,10 +474,31 @@ class AudioPipeline:
         if self.center_start < 0 or self.center_start + self.center_num_samples > self.window_num_samples:
             raise ValueError("Invalid center region for window/hop configuration")
 
-        self._buffer = np.empty((0,), dtype=np.float32)
-        self._start = 0
+        self._spec = AudioChunkSpec(
+            sample_rate=self.target_sample_rate,
+            window_num_samples=self.window_num_samples,
+            hop_num_samples=self.hop_num_samples,
+            center_start=self.center_start,
+            center_num_samples=self.center_num_samples,
+        )
+
+        # Ring buffer of resampled audio. The first `window_num_samples` slots are mirrored
+        # past `_capacity`, so a window that wraps around is still one contiguous slice.
+        self._capacity = self.window_num_samples * 8
+        self._buffer = np.zeros((self._capacity + self.window_num_samples,), dtype=np.float32)
+        self._read_idx = 0
+        self._write_idx = 0
+        self._num_buffered = 0
         self._ended = False
 
+        self._downmix_buffer = np.empty((0,), dtype=np.float32)
+
+        # Resampling parameters for the most recent input rate; TTS input rarely changes rate
+        self._last_sr = None
+        self._up = None
+        self._down = None
+        self._taps = None
+
         # Sequence number for windows
         self.seq_counter = 0
         
@@ -127,17 +508,31 @@ class AudioPipeline:
         """
         Ingest audio data, resample to target rate, and append to buffer.
         Assumes pcm_data is numpy array. If stereo, converts to mono.
+        Integer PCM (int16/int32/uint8) is normalized to float32 in [-1.0, 1.0).
         """
-        # 1. Convert to mono if necessary
-        if pcm_data.ndim > 1 and pcm_data.shape[1] > 1:
-            pcm_data = np.mean(pcm_data, axis=1, dtype=np.float32)
+        # 0. Normalize integer PCM. Mono input already at the target rate (e.g. 16 kHz int16 TTS)
+        #    is converted straight into the ring, without an intermediate float32 array.
+        scaling = _INT_PCM_SCALING.get(pcm_data.dtype)
+        if scaling is not None:
+            if pcm_data.ndim == 1 and original_sample_rate == self.target_sample_rate:
+                if len(pcm_data) > 0:
+                    self._write_int(pcm_data, *scaling)
+                return
+            pcm_data = _int_to_float32(pcm_data, *scaling)
+
+        # 1. Convert to mono if necessary; 1-D input (the usual TTS case) passes straight through
+        if pcm_data.ndim > 1:
+            if pcm_data.shape[1] > 1:
+                pcm_data = self._downmix(pcm_data)
+            else:
+                pcm_data = pcm_data.reshape(-1)
             
         # 2. Resample if necessary
         if original_sample_rate != self.target_sample_rate:
-            gcd = math.gcd(original_sample_rate, self.target_sample_rate)
-            up = self.target_sample_rate // gcd
-            down = original_sample_rate // gcd
-            pcm_data = signal.resample_poly(pcm_data, up, down)
+            if original_sample_rate != self._last_sr:
+                self._up, self._down, self._taps = _resample_filter(int(original_sample_rate), int(self.target_sample_rate))
+                self._last_sr = original_sample_rate
+            pcm_data = _resample_poly(pcm_data, self._up, self._down, self._taps)
             if pcm_data.dtype != np.float32:
                  pcm_data = pcm_data.astype(np.float32)
             
@@ -148,20 +543,110 @@ class AudioPipeline:
         if len(pcm_data) > 0:
             if pcm_data.dtype != np.float32:
                 pcm_data = pcm_data.astype(np.float32)
-            self._buffer = np.concatenate([self._buffer, pcm_data])
-        
+            self._write(pcm_data)
+
+    def _downmix(self, pcm_data: np.ndarray) -> np.ndarray:
+        """
+        Average the channels of (frames, channels) audio into a reused float32 scratch buffer.
+        The result is only valid until the next call; add_audio copies it out before then.
+        """
+        num_frames, channels = pcm_data.shape
+        if self._downmix_buffer.shape[0] < num_frames:
+            self._downmix_buffer = np.empty((num_frames,), dtype=np.float32)
+
+        out = self._downmix_buffer[:num_frames]
+        np.add(pcm_data[:, 0], pcm_data[:, 1], out=out, dtype=np.float32)
+        for channel in range(2, channels):
+            np.add(out, pcm_data[:, channel], out=out, dtype=np.float32)
+        out *= np.float32(1.0 / channels)
+        return out
+
+    def _write(self, pcm_data: np.ndarray):
+        """Copy samples into the ring at the write cursor."""
+        head, tail = self._reserve(pcm_data.shape[0])
+        np.copyto(head, pcm_data[:head.shape[0]])
+        np.copyto(tail, pcm_data[head.shape[0]:])
+        self._advance_write(pcm_data.shape[0])
+
+    def _write_int(self, pcm_data: np.ndarray, bias: float, scale: float):
+        """Normalize integer samples into the ring at the write cursor, like `_int_to_float32`."""
+        head, tail = self._reserve(pcm_data.shape[0])
+        _int_to_float32(pcm_data[:head.shape[0]], bias, scale, out=head)
+        _int_to_float32(pcm_data[head.shape[0]:], bias, scale, out=tail)
+        self._advance_write(pcm_data.shape[0])
+
+    def _write_silence(self, num_samples: int):
+        """Write `num_samples` zeros at the write cursor without allocating them first."""
+        head, tail = self._reserve(num_samples)
+        head.fill(0.0)
+        tail.fill(0.0)
+        self._advance_write(num_samples)
+
+    def _reserve(self, num_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the ring slices the next `num_samples` go into (the second is empty unless the
+        write wraps), growing the ring only if they don't fit in the free space.
+
+        The `window_num_samples` slots behind the read cursor are never handed out: they still
+        hold the window `get_next_window` returned last, which the caller may be holding.
+        """
+        if num_samples > self._capacity - self._num_buffered - self.window_num_samples:
+            self._grow(self._num_buffered + num_samples + self.window_num_samples)
+
+        start = self._write_idx
+        first = min(num_samples, self._capacity - start)
+        return self._buffer[start:start + first], self._buffer[:num_samples - first]
+
+    def _advance_write(self, num_samples: int):
+        """Publish `num_samples` filled in via `_reserve` and move the write cursor past them."""
+        start = self._write_idx
+        first = min(num_samples, self._capacity - start)
+
+        # Keep the mirrored head in sync with whatever was written into it.
+        if start < self.window_num_samples:
+            end = min(start + first, self.window_num_samples)
+            self._buffer[self._capacity + start:self._capacity + end] = self._buffer[start:end]
+        if first < num_samples:
+            end = min(num_samples - first, self.window_num_samples)
+            self._buffer[self._capacity:self._capacity + end] = self._buffer[:end]
+
+        self._write_idx = (start + num_samples) % self._capacity
+        self._num_buffered += num_samples
+
+    def _grow(self, required: int):
+        """Reallocate the ring with room for `required` samples, unwrapping the buffered audio to the front."""
+        capacity = self._capacity
+        while capacity < required:
+            capacity *= 2
+
+        buffer = np.zeros((capacity + self.window_num_samples,), dtype=np.float32)
+        first = min(self._num_buffered, self._capacity - self._read_idx)
+        buffer[:first] = self._buffer[self._read_idx:self._read_idx + first]
+        buffer[first:self._num_buffered] = self._buffer[:self._num_buffered - first]
+        buffer[capacity:] = buffer[:self.window_num_samples]
+
+        self._capacity = capacity
+        self._buffer = buffer
+        self._read_idx = 0
+        self._write_idx = self._num_buffered
+
     def get_next_window(self, stream_id: str) -> Optional[AudioChunk]:
         """
         Extracts the next 1.0s window from the buffer if available.
         Returns None if not enough data.
+
+        The returned chunk's `pcm` is a read-only view into the ring buffer, not a copy.
+        It stays valid however much audio is added afterwards, but only until the next
+        `get_next_window` or `flush` call, after which the ring may reuse its slots; copy it
+        if it has to be kept around longer.
         """
-        available = len(self._buffer) - self._start
-        if available < self.window_num_samples:
+        if self._num_buffered < self.window_num_samples:
             return None
             
-        window_start = self._start
+        window_start = self._read_idx
         window_end = window_start + self.window_num_samples
-        window_pcm = self._buffer[window_start:window_end].copy()
+        window_pcm = self._buffer[window_start:window_end]
+        window_pcm.flags.writeable = False
 
         window_time_ns = int((self._next_window_start_sample_index / self.target_sample_rate) * 1e9)
         center_time_ns = int(((self._next_window_start_sample_index + self.center_start) / self.target_sample_rate) * 1e9)
@@ -170,31 +655,30 @@ class AudioPipeline:
             stream_id=stream_id,
             seq=self.seq_counter,
             pcm=window_pcm,
-            sample_rate=self.target_sample_rate,
-            window_num_samples=self.window_num_samples,
-            hop_num_samples=self.hop_num_samples,
-            center_start=self.center_start,
-            center_num_samples=self.center_num_samples,
             window_time_ns=window_time_ns,
             center_time_ns=center_time_ns,
             audio_time_ns=center_time_ns,
+            spec=self._spec,
         )
         
         # Update counters
         self.seq_counter += 1
-        self._start += self.hop_num_samples
+        self._read_idx = (self._read_idx + self.hop_num_samples) % self._capacity
+        self._num_buffered -= self.hop_num_samples
         self._next_window_start_sample_index += self.hop_num_samples
-
-        if self._start >= self.window_num_samples * 4:
-            self._buffer = self._buffer[self._start:]
-            self._start = 0
         
         return chunk
         
     def flush(self):
         """Clear buffer and reset counters"""
-        self._buffer = np.empty((0,), dtype=np.float32)
-        self._start = 0
+        # Release whatever a large add_audio grew the ring (and downmix scratch) to
+        if self._capacity != self.window_num_samples * 8:
+            self._capacity = self.window_num_samples * 8
+            self._buffer = np.zeros((self._capacity + self.window_num_samples,), dtype=np.float32)
+        self._downmix_buffer = np.empty((0,), dtype=np.float32)
+        self._read_idx = 0
+        self._write_idx = 0
+        self._num_buffered = 0
         self._ended = False
         self.seq_counter = 0
         self._next_window_start_sample_index = 0
@@ -207,7 +691,7 @@ class AudioPipeline:
         if extra_hops < 0:
             raise ValueError("extra_hops must be >= 0")
 
-        available = len(self._buffer) - self._start
+        available = self._num_buffered
         if available <= 0:
             return
 
@@ -220,7 +704,7 @@ class AudioPipeline:
         if pad_len <= 0:
             return
 
-        self._buffer = np.concatenate([self._buffer, np.zeros((pad_len,), dtype=np.float32)])
+        self._write_silence(pad_len)
 
     def get_buffer_fill_ms(self):
-        return ((len(self._buffer) - self._start) / self.target_sample_rate) * 1000.0
+        return (self._num_buffered / self.target_sample_rate) * 1000.0
@@ -31,7 +31,7 @@ class TTSAdapter:
         if not self.is_active:
             return
             
-        # Convert bytes to numpy array
+        # Convert bytes to numpy array (zero-copy); the pipeline normalizes integer PCM itself
         pcm_data = np.frombuffer(audio_bytes, dtype=dtype)
         
         # Reshape if multiple channels
@@ -1,29 +1,110 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import json
+import multiprocessing
+import os
+import signal
 import struct
+import sys
+import threading
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
-from ingest.audio_pipeline import process_wav_bytes_to_pcm16_chunks
+from ingest.audio_pipeline import process_wav_bytes_to_pcm16_chunks, set_num_threads
 
 
-def pack_processed_audio(sample_rate: int, chunks: list[tuple[int, bytes]]) -> bytes:
-    out = bytearray()
-    out += b"A2PC"  # Audio2Face Processed Chunks
-    out += struct.pack("<III", 1, int(sample_rate), len(chunks))
-    for start_sample_index, pcm16le in chunks:
+def processed_audio_size(chunks: list[tuple[int, bytes]]) -> int:
+    total = 16
+    for _, pcm16le in chunks:
         if (len(pcm16le) % 2) != 0:
             raise ValueError("PCM16 chunk must have an even byte length")
+        total += 12 + len(pcm16le)
+    return total
+
+
+def pack_processed_audio(sample_rate: int, chunks: list[tuple[int, bytes]]) -> bytes:
+    total = processed_audio_size(chunks)
+
+    # Size the buffer once up front; everything below is a pack_into/memcpy into it.
+    out = bytearray(total)
+    struct.pack_into("<4sIII", out, 0, b"A2PC", 1, int(sample_rate), len(chunks))  # Audio2Face Processed Chunks
+    offset = 16
+    for start_sample_index, pcm16le in chunks:
         sample_count = len(pcm16le) // 2
-        out += struct.pack("<qI", int(start_sample_index), int(sample_count))
-        out += pcm16le
+        struct.pack_into("<qI", out, offset, int(start_sample_index), int(sample_count))
+        offset += 12
+        out[offset:offset + len(pcm16le)] = pcm16le
+        offset += len(pcm16le)
     return bytes(out)
 
 
+def write_processed_audio(wfile, sample_rate: int, chunks: list[tuple[int, bytes]]) -> None:
+    """Write the same bytes as `pack_processed_audio` to `wfile` without building them in memory first."""
+    parts = [struct.pack("<4sIII", b"A2PC", 1, int(sample_rate), len(chunks))]
+    for start_sample_index, pcm16le in chunks:
+        parts.append(struct.pack("<qI", int(start_sample_index), len(pcm16le) // 2))
+        parts.append(pcm16le)
+    wfile.writelines(parts)
+
+
+# Decode/resample/quantize is CPU-bound, so uploads are processed in worker processes rather than
+# on the GIL-bound request threads. Created in main() so that spawned workers importing this
+# module don't build pools of their own.
+EXECUTOR: Optional[ProcessPoolExecutor] = None
+EXECUTOR_LOCK = threading.Lock()
+
+
+def new_executor() -> ProcessPoolExecutor:
+    # One single-threaded worker per CPU: concurrent uploads already fill the machine, so the
+    # kernels inside a worker must not fan out to every CPU again. Workers are spawned, not
+    # forked: they start on the first upload, from a request thread, and a forked worker would
+    # inherit the listening socket and outlive the server holding it.
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=set_num_threads,
+        initargs=(1,),
+    )
+
+
+def process_in_executor(wav_bytes: bytes, target_sr: int, chunk_s: float) -> tuple[int, list[tuple[int, bytes]]]:
+    """
+    Run `process_wav_bytes_to_pcm16_chunks` on `EXECUTOR`.
+
+    A worker that dies (e.g. OOM-killed on a huge upload) breaks the whole pool, so a broken pool
+    is replaced before `BrokenProcessPool` is re-raised; later uploads then work again.
+    """
+    global EXECUTOR
+    executor = EXECUTOR
+    try:
+        return executor.submit(
+            process_wav_bytes_to_pcm16_chunks, wav_bytes, target_sample_rate=target_sr, chunk_duration_s=chunk_s
+        ).result()
+    except BrokenProcessPool:
+        with EXECUTOR_LOCK:
+            # Requests that were in flight on the same pool all fail; only the first replaces it.
+            if EXECUTOR is executor:
+                EXECUTOR = new_executor()
+                executor.shutdown(wait=False)
+        raise
+
+
+class ViewerHTTPServer(ThreadingHTTPServer):
+    request_queue_size = 64
+
+
 class Handler(SimpleHTTPRequestHandler):
+    # Buffer the response so the status line, headers and the many small chunk headers of a
+    # processed-audio body go out in large sends; with Nagle off nothing waits on delayed ACKs.
+    rbufsize = 1 << 16
+    wbufsize = 1 << 20
+    disable_nagle_algorithm = True
+
     def end_headers(self) -> None:
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET,POST,OPTIONS")
@@ -54,10 +135,20 @@ class Handler(SimpleHTTPRequestHandler):
         chunk_s = float(qs.get("chunk_s", ["1.0"])[0])
 
         try:
-            sample_rate, chunks = process_wav_bytes_to_pcm16_chunks(
-                wav_bytes, target_sample_rate=target_sr, chunk_duration_s=chunk_s
-            )
-            payload = pack_processed_audio(sample_rate, chunks)
+            if EXECUTOR is not None:
+                sample_rate, chunks = process_in_executor(wav_bytes, target_sr, chunk_s)
+            else:
+                sample_rate, chunks = process_wav_bytes_to_pcm16_chunks(
+                    wav_bytes, target_sample_rate=target_sr, chunk_duration_s=chunk_s
+                )
+            total = processed_audio_size(chunks)
+        except BrokenProcessPool:
+            self.send_response(503)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Retry-After", "1")
+            self.end_headers()
+            self.wfile.write(json.dumps({"error": "Audio worker crashed; please retry"}).encode("utf-8"))
+            return
         except Exception as e:
             self.send_response(400)
             self.send_header("Content-Type", "application/json; charset=utf-8")
@@ -67,9 +158,9 @@ class Handler(SimpleHTTPRequestHandler):
 
         self.send_response(200)
         self.send_header("Content-Type", "application/octet-stream")
-        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Content-Length", str(total))
         self.end_headers()
-        self.wfile.write(payload)
+        write_processed_audio(self.wfile, sample_rate, chunks)
 
 
 def main() -> int:
@@ -83,10 +174,20 @@ def main() -> int:
     def handler(*handler_args, **handler_kwargs):
         return Handler(*handler_args, directory=str(root), **handler_kwargs)
 
-    httpd = ThreadingHTTPServer((args.host, args.port), handler)
+    # Turn SIGTERM into a normal exit so the finally below shuts the worker pool down; killed
+    # outright, the server would leave its workers orphaned.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
+    global EXECUTOR
+    EXECUTOR = new_executor()
+
+    httpd = ViewerHTTPServer((args.host, args.port), handler)
     print(f"Serving viewer on http://{args.host}:{args.port}/")
     print("Audio processing endpoint: POST /api/process_audio (WAV bytes)")
-    httpd.serve_forever()
+    try:
+        httpd.serve_forever()
+    finally:
+        EXECUTOR.shutdown()
     return 0
 
 